@@ -140,24 +140,22 @@ def aggexec(apps):
 				print(TIMESTAMP_START_HEADER, file=outres)
 				print(TIMESTAMP_START_HEADER, file=outresx)
 				# Output header, which might differ for distinct runs by number of apps
-				outres.write('# <dataset>')
-				for app in mapps:
-					outres.write('\t{}'.format(app))
-				outres.write('\n')
+				outres.write('\t'.join(['# <dataset>'] + mapps) + '\n')
 				# Output results for each dataset
+				# Note: each row is formed and written at once rather than cell by cell
 				for dname, dstats in viewitems(measures[imsr]):
-					outres.write(dname)
-					outresx.write(dname)
+					row = [dname]
+					rowx = [dname]
 					for iapp, stat in enumerate(dstats):
 						if not stat.fixed:
 							stat.fix()
 						# Output sum for time, but avg for mem
 						val = stat.sum if imsr < len(mnames) - 1 else stat.avg
-						outres.write('\t{:.3f}'.format(val))
-						outresx.write('\n\t{}>\ttotal: {:.3f}, per_item: {:.6f} ({:.6f} .. {:.6f})'
+						row.append('{:.3f}'.format(val))
+						rowx.append('\t{}>\ttotal: {:.3f}, per_item: {:.6f} ({:.6f} .. {:.6f})'
 							.format(mapps[iapp], val, stat.avg, stat.min, stat.max))
-					outres.write('\n')
-					outresx.write('\n')
+					outres.write('\t'.join(row) + '\n')
+					outresx.write('\n'.join(rowx) + '\n')
 		except IOError as err:
 			print('ERROR, "{}" resources consumption output is failed: {}. {}'
 				.format(measure, err, traceback.format_exc(5)), file=sys.stderr)
@@ -32,6 +32,10 @@
 
 		return  jobsnum: uint  - the number of started jobs
 
+	NOTE: the arguments validation of the frequently constructed meta entries (SMeta, QEntry, NetInfo)
+	is performed only in the debug mode, so the production benchmarking should be run in the
+	optimized mode: $ python -O ./benchmark.py ...  (or with PYTHONOPTIMIZE=1).
+
 
 :Authors: (c) Artem Lutov <artem@exascale.info>
 :Organizations: eXascale Infolab <http://exascale.info/>, Lumais <http://www.lumais.com/>, ScienceWise <http://sciencewise.info/>
@@ -39,6 +43,7 @@
 """
 from __future__ import print_function, division  # Required for stderr output, must be the first import
 import os
+import re
 # import shutil
 import glob
 import sys
@@ -49,12 +54,6 @@ if not hasattr(time, 'perf_counter'):  #pylint: disable=C0413
 	time.perf_counter = time.time
 
 from subprocess import PIPE
-# Queue is required to asynchronously save evaluated quality measures to the persistent storage
-from multiprocessing import cpu_count  # , Value, sharedctypes, Process, Queue
-# try:
-# 	import queue  # queue in Python3
-# except ImportError:  # Queue in Python2
-# 	import Queue as queue  # For exceptions handling: queue.Full, etc.
 
 # Required for the aggregation of the quality evaluations
 import math
@@ -66,6 +65,10 @@ from collections import namedtuple
 # Required for the quality evaluation persistence
 import numpy as np  # Required for the HDF5 operations
 import h5py  # HDF5 storage
+try:
+	import hdf5plugin  # Optional Blosc/LZ4 HDF5 compression filters
+except ImportError:
+	hdf5plugin = None
 
 # from benchapps import  # funcToAppName,
 from benchutils import viewitems, viewvalues, syncedTime, \
@@ -86,6 +89,12 @@ except NameError:  # bytes are not defined in Python2
 	h5ustr = h5py.special_dtype(vlen=unicode)  #pylint: disable=E0602;  # UTF8 str
 	# Note: str.decode() converts bytes to Unicode str, str.encode() converts (Unicode) str to bytes
 
+# Strings interning (deduplication) for both Python 2 and 3
+try:
+	intern = sys.intern  #pylint: disable=W0622;  # Python3
+except AttributeError:
+	pass  # intern() is a builtin in Python2
+
 # Note: '/' is required in the end of the dir to evaluate whether it is already exist and distinguish it from the file
 RESDIR = 'results/'  # Final accumulative results of .mod, .nmi and .rcp for each algorithm, specified RELATIVE to ALGSDIR
 CLSDIR = 'clusters/'  # Clusters directory for the resulting clusters of algorithms execution
@@ -106,10 +115,22 @@ _SEPQARGS = '_'  # Separator for the quality measure arguments to be shown in th
 # It is used for the file names and should follow restrictions on the allowed symbols.
 _SEPQMS = ';'
 _PREFMETR = ':'  # Metric prefix in the HDF5 dataset name
+_RESEPMETRS = re.compile('[,;(]')  # Separators of the metrics in the quality measure output
+_REMETRVAL = re.compile(r'\s*(?:([^:]+?)\s*:)?\s*([^\s)]+)')  # Metric name and value: [<metric>:] <value>[)]
 SUFULEV = '+s'  # Salient/significant/representative clusters, unified levels suffix of the HDF5 dataset (actual for DAOC)
 SATTRNINS = 'nins'  # HDF5 storage object attribute for the number of network instances
 SATTRNSHF = 'nshf'  # HDF5 storage object attribute for the number of network instance shuffles
 SATTRNLEV = 'nlev'  # HDF5 storage object attribute for the number of clustering levels
+SATTRSEED = 'seed'  # HDF5 storage (root) attribute for the benchmarking seed
+SATTRTIMESTAMPS = 'timestamps'  # HDF5 storage (root) attribute for the start times of the benchmarking (updates)
+# Dimensions of the raw quality measures datasets, zero terminated bytes of the fixed length
+# Note: the dimension is implicitly omitted in the visualizing table if its size equals to 1
+_DIMS_QMS_RAW = np.array(('inst', 'shuf', 'levl', 'mrun'), dtype='a5')
+# Chunk cache of the HDF5 storage: many small datasets are updated round-robin by the evaluations,
+# which evicts the chunks on each saving with the default cache (1 MB, 521 slots)
+_RDCC_NBYTES = 64 * 1024 * 1024  # Chunk cache size in bytes
+_RDCC_NSLOTS = 10007  # Number of the chunk slots, a prime number ~10x larger than the number of the datasets
+_RDCC_W0 = 0.75  # Eviction policy of the chunks, preferring fully read/written chunks
 
 QMSRAFN = {}  # Specific affinity mask of the quality measures: str, AffinityMask;  qmsrAffinity
 QMSINTRIN = set()  # Intrinsic quality measures requiring input network instead of the ground-truth clustering
@@ -119,6 +140,16 @@ QMSRUNS = {}  # Run the respective stochastic quality measures specified number
 
 _DEBUG_TRACE = False  # Trace start / stop and other events to stderr
 
+# Memoized invariant paths of the quality measure jobs, which are the same for all the evaluating clusterings
+_QMPATHS = {}  # (algname, basenetp, measurep, workdir): (logsdir, xtimebin, xtimeopt, xtimesect)
+_INPRELPATHS = {}  # Relative paths of the input datasets (networks / ground-truth): (inpfpath, workdir): str
+_INPSIZES = {}  # Sizes of the input datasets (networks / ground-truth) in bytes: inpfpath: uint
+_QPEVALIDS = {}  # Indices of the clustering evaluation options (-e) in the Imeasures parameters: measurep: tuple(uint)
+# Logs directories of the quality measures that have been ensured to exist
+# Note: ExecPool removes the empty logs with their dir but recreates the dir of the stderr file on the job start
+_LOGSDIRS = set()
+_LOGTAILSIZE = 4096  # Size of the tail in bytes read from the quality measure log to fetch the last ntail lines
+
 # # Accessory Routines -----------------------------------------------------------
 # def toH5str(text):
 # 	"""Convert text to the h5str
@@ -212,22 +243,32 @@ class NetInfo(object):
 		"""
 		# gvld: bool or None  - whether the respective HDF5 group entry attributes have been validated for this netinfo
 		# 	(exception is raised on the failed validation)
-		assert nins >= 1 and isinstance(nins, int) and nshf >= 1 and isinstance(
-			nshf, int), 'Invalid arguments  nins: {}, nshf: {}'.format(nins, nshf)
+		if __debug__:
+			NetInfo._validate(nins, nshf)
 		self.nins = nins
 		self.nshf = nshf
 		# self.gvld = False
 
+	@staticmethod
+	def _validate(nins, nshf):
+		"""Validate the constructor arguments (omitted in the optimized mode: python -O)"""
+		assert nins >= 1 and isinstance(nins, int) and nshf >= 1 and isinstance(
+			nshf, int), 'Invalid arguments  nins: {}, nshf: {}'.format(nins, nshf)
+
 	def __str__(self):
 		"""String conversion"""
-		return ', '.join(': '.join((name, str(self.__getattribute__(name))))for name in self.__slots__)
+		return 'nins: {}, nshf: {}'.format(self.nins, self.nshf)
 
 
-class SMeta(object):
-	"""Serialization meta information (data cell location)"""
-	__slots__ = ('group', 'measure', 'ulev', 'iins', 'ishf', 'ilev', 'irun', 'ppeval')
+class SMeta(namedtuple('SMeta', 'group measure ulev iins ishf ilev irun ppeval')):
+	"""Serialization meta information (data cell location)
 
-	def __init__(self, group, measure, ulev, iins, ishf, ilev=0, irun=0, ppeval=False):
+	The tuple base allows to unpack all the fields at once on the serialization
+	instead of the per-attribute dereferencing.
+	"""
+	__slots__ = ()
+
+	def __new__(cls, group, measure, ulev, iins, ishf, ilev=0, irun=0, ppeval=False):
 		"""Serialization meta information (location in the storage)
 
 		group: str  - h5py.Group name where the target dataset is located: <algname>/<basenet><pathid>/
@@ -242,24 +283,24 @@ class SMeta(object):
 			instead of the evaluation vs the ground-truth. Actual for the link reduced synthetic networks.
 		"""
 		# alg: str  - algorithm name, required to only to structure (order) the output results
+		if __debug__:
+			SMeta._validate(group, measure, ulev, iins, ishf, ilev, irun)
+		# Note: group name is used since the opened group object can not be marshaled to another process
+		return super(SMeta, cls).__new__(cls, group, measure, ulev, iins, ishf, ilev, irun, ppeval)
+
+	@staticmethod
+	def _validate(group, measure, ulev, iins, ishf, ilev, irun):
+		"""Validate the constructor arguments (omitted in the optimized mode: python -O)"""
 		assert isinstance(group, str) and isinstance(measure, str) and iins >= 0 and isinstance(
 			iins, int) and ishf >= 0 and isinstance(ishf, int) and ilev >= 0 and isinstance(
 			ilev, int) and irun >= 0 and isinstance(irun, int), (
 			'Invalid arguments:\n\tgroup: {group}\n\tmeasure: {measure}\n\tulev: {ulev}\n\t'
 			'iins: {iins}\n\tishuf: {ishf}\n\tilev: {ilev}\n\tirun: {irun}'.format(
 			group=group, measure=measure, ulev=ulev, iins=iins, ishf=ishf, ilev=ilev, irun=irun))
-		self.group = group  # Group name since the opened group object can not be marshaled to another process
-		self.measure = measure
-		self.ulev = ulev
-		self.iins = iins
-		self.ishf = ishf
-		self.ilev = ilev
-		self.irun = irun
-		self.ppeval = ppeval
 
 	def __str__(self):
 		"""String conversion"""
-		return ', '.join(': '.join((name, str(self.__getattribute__(name)))) for name in self.__slots__)
+		return ', '.join(': '.join((name, str(val))) for name, val in zip(self._fields, self))
 
 
 class QEntry(object):
@@ -272,6 +313,14 @@ class QEntry(object):
 		smeta: SMeta  - serialization meta data
 		data: dict(name: str, val: float32)  - serializing data
 		"""
+		if __debug__:
+			QEntry._validate(smeta, data)
+		self.smeta = smeta
+		self.data = data
+
+	@staticmethod
+	def _validate(smeta, data):
+		"""Validate the constructor arguments (omitted in the optimized mode: python -O)"""
 		assert isinstance(smeta, SMeta) and data and isinstance(data, dict), (
 			'Invalid type of the arguments, smeta: {}, data: {}'.format(
 			type(smeta).__name__, type(data).__name__))
@@ -279,115 +328,25 @@ class QEntry(object):
 		# name, val = next(iter(data))
 		# assert isinstance(name, str) and isinstance(val, float), (
 		# 	'Invalid type of the data items, name: {}, val: {}'.format(type(name).__name__, type(val).__name__)))
-		self.smeta = smeta
-		self.data = data
 
 	def __str__(self):
 		"""String conversion"""
-		return ', '.join(': '.join((name, str(self.__getattribute__(name)))) for name in self.__slots__)
+		return 'smeta: {}, data: {}'.format(self.smeta, self.data)
 
 
 class QualitySaver(object):
-	"""Quality evaluations saver to the persistent storage"""
-	# Max number of the buffered items in the queue that have not been processed
-	# before blocking the caller on appending more items
-	# Should not be too much to save them into the persistent store on the
-	# program termination or any external interruptions
-	QUEUE_SIZEMAX = max(128, cpu_count() * 2)  # At least 128 or twice the number of the logical CPUs in the system
-	ntail = -2  # Target tail lines in the job results, <= -1
+	"""Quality evaluations saver to the persistent storage
 
-	# LATENCY = 1  # Latency in seconds
+	NOTE: the evaluations are saved in the main thread of the main process from the ondone
+	callbacks of the executed jobs (parsing only their piped output), which are called by
+	ExecPool sequentially on the jobs completion. So the quality values are not marshaled
+	between processes, no IPC buffering (queue / shared memory) is required and the storage
+	is accessed without any locking.
+	"""
+	ntail = -2  # Target tail lines in the job results, <= -1
+	PENDING_MAX = 1024  # Max number of the buffered values before their writing to the storage
 
-	# TODO: Efficient multiprocess implementation requires a single instance of the storage to not reload
-	# the storage after each creation of a new group or dataset in it. So, group and dataset creation requests
-	# should be performed via the queue together with the ordinary data entry creation requests implemented as follows.
-	# @staticmethod
-	# def __datasaver(qsqueue, syncstorage, active, timeout=None, latency=2.):
-	# 	"""Worker process function to save data to the persistent storage
-	#
-	# 	qsqueue: Queue  - quality saver queue of QEntry items
-	# 	syncstorage: h5py.File  - synchronized wrapper of the HDF5 storage
-	# 	active: Value('B', lock=False)  - the saver process is operational (the requests can be processed)
-	# 	timeout: float  - global operational timeout in seconds, None means no timeout
-	# 	latency: float  - latency of the datasaver in sec, recommended value: 1-3 sec
-	# 	"""
-	# 	# def fetchAndSave():
-	#
-	# 	tstart = time.perf_counter()  # Global start time
-	# 	tcur = tstart  # Start of the current iteration
-	# 	while (active.value and (timeout is None or tcur - tstart < timeout)):
-	# 		# Fetch and serialize items from the queue limiting their number
-	# 		# (can be added in parallel) to avoid large latency
-	# 		i = 0
-	# 		while not qsqueue.empty() and i < QualitySaver.QUEUE_SIZEMAX:
-	# 			i += 1
-	# 			# qm = qsqueue.get(True, timeout=latency)  # Measures to be stored
-	# 			qm = qsqueue.get_nowait()
-	# 			assert isinstance(qm, QEntry), 'Unexpected type of the quality entry: ' + type(qm).__name__
-	# 			# Save data elements (entries)
-	# 			for metric, mval in  viewitems(qm.data):
-	# 				try:
-	# 					# Metric is  str (or can be unicode in Python2)
-	# 					assert isinstance(mval, float), 'Invalid data type, metric: {}, value: {}'.format(
-	# 						type(metric).__name__, type(mval).__name__)
-	# 					# Construct dataset name based on the quality measure binary name and its metric name
-	# 					# (in case of multiple metrics are evaluated by the executing app)
-	# 					dsname = qm.smeta.measure if not metric else _PREFMETR.join((qm.smeta.measure, metric))
-	# 					if qm.smeta.ulev:
-	# 						dsname += SUFULEV
-	# 					dsname += _EXTQDATASET
-	# 					# Open or create the required dataset
-	# 					qmgroup = syncstorage.value[qm.smeta.group]
-	# 					qmdata = None
-	# 					try:
-	# 						qmdata = qmgroup[dsname]
-	# 					except KeyError:
-	# 						# Such dataset does not exist, create it
-	# 						nins = 1
-	# 						nshf = 1
-	# 						nlev = 1
-	# 						if not qm.smeta.ulev:
-	# 							nins = qmgroup.attrs[SATTRNINS]
-	# 							nshf = qmgroup.attrs[SATTRNSHF]
-	# 							nlev = qmgroup.parent.attrs[SATTRNLEV]
-	# 						qmdata = qmgroup.create_dataset(dsname, shape=(nins, nshf, nlev, QMSRUNS.get(qm.smeta.measure, 1)),
-	# 							# 32-bit floating number, checksum (fletcher32)
-	# 							dtype='f4', fletcher32=True, fillvalue=np.float32(np.nan), track_times=True)
-	# 							# NOTE: Numpy NA (not available) instead of NaN (not a number) might be preferable
-	# 							# but it requires latest NumPy versions.
-	# 							# https://www.numpy.org/NA-overview.html
-	# 							# Numpy NAs (https://docs.scipy.org/doc/numpy-1.14.0/neps/missing-data.html):
-	# 							# np.NA,  dtype='NA[f4]', dtype='NA', np.dtype('NA[f4,NaN]')
-	# 					# Save data to the storage
-	# 					with syncstorage.get_lock():
-	# 						qmdata[qm.smeta.iins][qm.smeta.ishf][qm.smeta.ilev][qm.smeta.irun] = mval
-	# 				except Exception as err:  #pylint: disable=W0703;  # queue.Empty as err:  # TypeError (HDF5), KeyError
-	# 					print('ERROR, saving of {} in {}{}{} failed: {}. {}'.format(mval, qm.smeta.measure,
-	# 						'' if not metric else _PREFMETR + metric, '' if not qm.smeta.ulev else SUFULEV,
-	# 						err, traceback.format_exc(5)), file=sys.stderr)
-	# 				# alg = apps.require_dataset('Pscan01'.encode(),shape=(0,),dtype=h5py.special_dtype(vlen=bytes),chunks=(10,),maxshape=(None,),fletcher32=True)
-	# 				# 	# Allocate chunks of 10 items starting with empty dataset and with possibility
-	# 				# 	# to resize up to 500 items (params combinations)
-	# 				# 	self.apps[app] = appsdir.require_dataset(app, shape=(0,), dtype=h5py.special_dtype(vlen=_h5str)
-	# 				# 		, chunks=(10,), maxshape=(500,))  # , maxshape=(None,), fletcher32=True
-	# 				# self.evals = self.storage.require_group('evals')  # Quality evaluations dir (group)
-	# 		# Prepare for the next iteration considering the processing latency to reduce CPU loading
-	# 		duration = time.perf_counter() - tcur
-	# 		if duration < latency:
-	# 			time.sleep(latency - duration)
-	# 			duration = latency
-	# 		tcur += duration
-	# 	active.value = False
-	# 	if not qsqueue.empty():
-	# 		try:
-	# 			print('WARNING QualitySaver, {} items remained unsaved in the terminating queue'
-	# 				.format(qsqueue.qsize()))
-	# 		except NotImplementedError:
-	# 			print('WARNING QualitySaver, some items remained unsaved in the terminating queue')
-	# 	# Note: qsqueue closing in the worker process (here) causes exception on the QualSaver destruction
-	# 	# qsqueue.close()  # Close queue to prevent scheduling another tasks
-
-	def __init__(self, seed, update=False):  # , timeout=None;  algs, qms, nets=None
+	def __init__(self, seed, update=False, compression='gzip', chunks=None):  # , timeout=None;  algs, qms, nets=None
 		"""Creating or open HDF5 storage and prepare for the quality measures evaluations
 
 		Check whether the storage exists, copy/move old storage to the backup and
@@ -395,19 +354,31 @@ class QualitySaver(object):
 
 		seed: uint64  - benchmarking seed, natural number
 		update: bool  - update existing storage creating if not exists, or create a new one backing up the existent
+		compression: str|None  - compression filter of the created datasets: 'gzip' (portable), 'lzf' (h5py only),
+			'blosc' (Blosc/LZ4 via hdf5plugin, which is required also to read the storage) or None,
+			the checksum (fletcher32) is evaluated only for the uncompressed datasets
+		chunks: tuple(uint, uint, uint, uint)|None  - chunk shape of the created datasets: (instances, shuffles,
+			levels, runs) clipped to the dataset shape, automatic if None
 
 		Members:
 			storage: h5py.File  - HDF5 storage with synchronized access
 				ATTENTION: parallel write to the storage is not supported, i.e. requires synchronization layer
+			_dscache: dict((group: str, measure: str, metric: str, ulev: bool), h5py.Dataset)  - opened datasets
+			_dsnames: dict((measure: str, metric: str, ulev: bool), str)  - names of the datasets
+			_pending: dict(h5py.Dataset, list((SMeta, metric: str, mval: float, iins: uint
+				, idx: (ishf: uint, ilev: uint, irun: uint))))  - buffered values with their dataset indices
+			_npending: uint  - the number of the buffered values
+			_cfilter: dict  - compression filter arguments of the created datasets
+			_chunks: tuple(uint, uint, uint, uint)|None  - chunk shape of the created datasets
 		"""
-		# timeout: float  - global operational timeout in seconds, None means no timeout
-		# Members:
-		# 	_persister: Process  - persister worker process
-		# 	queue: Queue  - multiprocess queue whose items are saved (persisted)
-		# 	_active: Value('B')  - the storage is operational (the requests can be processed)
-
+		# Note: the members used by the destructor are initialized first, since it is called also on the failed construction
+		self.storage = None
+		self._pending = {}  # Buffered values to be written to the datasets
+		self._npending = 0  # The number of the buffered values
 		# and (timeout is None or timeout >= 0)
 		assert isinstance(seed, int), 'Invalid seed type: {}'.format(type(seed).__name__)
+		assert compression in (None, 'gzip', 'lzf', 'blosc'), 'Unexpected compression: {}'.format(compression)
+		assert chunks is None or (len(chunks) == 4 and min(chunks) >= 1), 'Unexpected chunks: {}'.format(chunks)
 		# Open or init the HDF5 storage
 		# self._tstart = time.perf_counter()
 		# self.timeout = timeout
@@ -419,113 +390,75 @@ class QualitySaver(object):
 			os.makedirs(qmsdir)
 		# HDF5 Storage: qmeasures_<seed>.h5
 		storage = ''.join((qmsdir, 'qmeasures_', seedstr, '.h5'))  # File name of the HDF5.storage
-		ublocksize = 512  # HDF5 .userblock size in bytes
-		ublocksep = ':'  # Userblock values separator
 		# try:
 		if os.path.isfile(storage):
-			# Read userblock: seed and timestamps, validate new seed and estimate whether
-			# there is enought space for one more timestamp
+			# Read the seed and timestamps from the root attributes and validate the new seed
 			bcksftime = None
 			if update:
 				try:
-					fstorage = h5py.File(storage, mode='r')  # ATTENTION: 'latest' libver viewing is not fully supported after HDFView 2.7.1
-					ublocksize = fstorage.userblock_size
-					fstorage.close()
-				except OSError:
-					print('WARNING, can not open the file {}, default userblock size will be used.'.format(
-						storage, file=sys.stderr))
-				with open(storage, 'r+b') as fstore:  # Open file for R/W in binary mode
-					# Note: userblock contains '<seed>:<timestamp1>:<timestamp2>...',
-					# where timestamp has timefmt
-					ublock = fstore.read(ublocksize).decode().rstrip('\0')
-					ubparts = ublock.split(ublocksep)
-					if len(ubparts) < 2:
+					with h5py.File(storage, mode='r') as fstorage:  # ATTENTION: 'latest' libver viewing is not fully supported after HDFView 2.7.1
+						stseed = fstorage.attrs.get(SATTRSEED)
+						tstamps = fstorage.attrs.get(SATTRTIMESTAMPS)
+					if stseed is None or tstamps is None or not len(tstamps):
 						update = False
-						print('ERROR, {} userblock should contain at least 2 items (seed and 1+ timestamp): {}.'
-							' The new store will be created.'.format(storage, ublock), file=sys.stderr)
-					if update and int(ubparts[0]) != seed:
+						print('ERROR, {} root attributes should contain the seed and 1+ timestamp'
+							' (the legacy userblock storage is not updated). The new store will be created.'
+							.format(storage), file=sys.stderr)
+					elif scalar(stseed) != seed:
 						update = False
 						print('WARNING, update is supported only for the same seed.'
 							' Specified seed {} != {} storage seed. New storage will be created.'
-							.format(seed, ubparts[0]), file=sys.stderr)
-					# Update userblock if possible
-					if update:
-						if len(ublock) + len(ublocksep) + len(timestamp) <= ublocksize:
-							fstore.seek(len(ublock))
-							# Note: .encode() is required for the byte stream in Python3
-							fstore.write(ublocksep.encode())  # Note: initially userblock is filled with 0
-							fstore.write(timestamp.encode())
-						else:
-							update = False
-							print('WARNING, {} can not be updated because the userblock is already full.'
-								' A new storage will be created.'.format(storage), file=sys.stderr)
-					bcksftime = syncedTime(time.strptime(ubparts[-1], timefmt), lock=False)  # Use last benchmarking start time
+							.format(seed, scalar(stseed)), file=sys.stderr)
+					if tstamps is not None and len(tstamps):
+						# Use last benchmarking start time
+						bcksftime = syncedTime(time.strptime(tstamps[-1].decode(), timefmt), lock=False)
+				except OSError as err:
+					update = False
+					print('WARNING, can not open the file {}: {}. New storage will be created.'.format(
+						storage, err), file=sys.stderr)
 			tobackup(storage, False, synctime=bcksftime, move=not update)  # Copy/move to the backup
 		elif update:
 			update = False
 			print('WARNING, the storage does not exist and can not be updated, created:', storage)
-		# Create HFD5 storage if required
-		if not update:
-			# Create the storage, fail if exists ('w-' or 'x')
-			fstorage = h5py.File(storage, mode='w-', userblock_size=ublocksize)  # ATTENTION: 'latest' libver viewing is not fully supported after HDFView 2.7.1
-			ubsize = fstorage.userblock_size  # Actual user block size of the storage
-			fstorage.close()
-			# Write the userblock
-			if (ubsize and len(seedstr) + len(ublocksep) + len(timestamp) <= ubsize):
-				with open(storage, 'r+b') as fstore:  # Open file for R/W in binary mode
-					fstore.write(seedstr.encode())  # Note: .encode() is required for the byte stream in Python3
-					fstore.write(ublocksep.encode())  # Note: initially userblock is filled with 0
-					fstore.write(timestamp.encode())
-					# Fill remained part with zeros to be sure that userblock is zeroed
-					fstore.write(('\0' * (ubsize - (len(seedstr) + len(ublocksep) + len(timestamp)))).encode())
-			else:
-				raise RuntimeError('ERROR, the userblock creation failed in the {}, userblock_size: {}'
-					', initial data size: {} (seed: {}, sep: {}, timestamp:{})'.format(storage, ubsize,
-					len(seedstr) + len(ublocksep) + len(timestamp), len(seedstr), len(ublocksep), len(timestamp)))
-			# print('> HDF5 storage userblock created: ', seedstr, ublocksep, timestamp)
 		# Note: append mode is the default one; core driver is a memory-mapped file, block_size is default (64 Kb)
-		# Persistent storage object (file)
-		self.storage = h5py.File(storage, mode='a', driver='core', libver='latest', userblock_size=ublocksize)  # ATTENTION: 'latest' libver viewing is not fully supported after HDFView 2.7.1
+		# Persistent storage object (file), the new storage is created failing if exists ('w-' or 'x')
+		self.storage = h5py.File(storage, mode='a' if update else 'w-', driver='core', libver='latest'
+			, rdcc_nbytes=_RDCC_NBYTES, rdcc_nslots=_RDCC_NSLOTS, rdcc_w0=_RDCC_W0)  # ATTENTION: 'latest' libver viewing is not fully supported after HDFView 2.7.1
+		# Note: HDF5 attributes can not be resized, so the timestamps are rewritten on update
+		if update:
+			tstamps = np.append(self.storage.attrs[SATTRTIMESTAMPS], np.bytes_(timestamp))
+		else:
+			self.storage.attrs[SATTRSEED] = np.uint64(seed)
+			tstamps = np.array((timestamp,), dtype='a' + str(len(timestamp)))
+		self.storage.attrs[SATTRTIMESTAMPS] = tstamps
+		# print('> HDF5 storage seed and timestamps: ', seedstr, tstamps)
+		self._dscache = {}  # Opened datasets indexed by their location to omit the names formation and lookup
+		self._dsnames = {}  # Names of the datasets indexed by their measure, metric and levels unification
+		if compression == 'blosc':
+			if hdf5plugin is not None:
+				# Note: Blosc performs the bytes shuffling itself
+				self._cfilter = dict(hdf5plugin.Blosc(cname='lz4', clevel=5, shuffle=hdf5plugin.Blosc.SHUFFLE))
+			else:
+				print('WARNING, hdf5plugin is not available, lzf compression is used instead of blosc', file=sys.stderr)
+				compression = 'lzf'
+		if compression != 'blosc':
+			# Note: the bytes shuffling of the (chunked) dataset improves compression of the float values,
+			# the checksum costs CPU per chunk and is evaluated only for the uncompressed datasets
+			self._cfilter = {'compression': compression, 'shuffle': compression is not None
+				, 'fletcher32': compression is None}
+		self._chunks = chunks
 		# Add attributes if required
 		dqrname = 'dims_qms_raw'
 		if self.storage.attrs.get(dqrname) is None or update:
 			# Describe dataset dimensions
-			# Note: the dimension is implicitly omitted in the visualizing table if its size equals to 1
-			dims_qms_raw = ('inst', 'shuf', 'levl', 'mrun')
-			dqrlen = max(len(s) for s in dims_qms_raw) + 1
-			dqrtype = 'a' + str(dqrlen)  # Zero terminated bytes, fixed length
 			# NOTE: the existing attribute is overwritten
-			self.storage.attrs.create(dqrname, data=np.array(dims_qms_raw, dtype=dqrtype))
-			# shape=(len(dims_qms_raw),), dtype=dqrtype)
+			self.storage.attrs.create(dqrname, data=_DIMS_QMS_RAW)
 			# dims_qms_agg = ('net'): ('avg', 'var', 'num')  # 'dims_qms_agg'
 
 		# except Exception as err:  #pylint: disable=W0703
 		# 	print('ERROR, HDF5 storage creation failed: {}. {}'.format(err, traceback.format_exc(5)), file=sys.stderr)
 		# 	raise
 
-		# Initialize or update metadata and groups
-		# # rescons meta data (h5str array)
-		# try:
-		# 	self.mrescons = [b.encode() for b in self.storage.value['rescons.inf'][()]]
-		# except KeyError:  # IndexError
-		# 	self.mrescons = ['ExecTime', 'CPU_time', 'RSS_peak']
-		# 	# Note: None in maxshape means resizable, fletcher32 used for the checksum
-		# 	self.storage.create_dataset('rescons.inf', shape=(len(self.mrescons),)
-		# 		, dtype=h5str, data=[s.decode() for s in self.mrescons], fletcher32=True)  # fillvalue=''
-		# # # Note: None in maxshape means resizable, fletcher32 used for the checksum,
-		# # # exact used to require shape and type to match exactly
-		# # metares = self.storage.require_dataset('rescons.meta', shape=(len(self.mrescons),), dtype=h5str
-		# # 	, data=self.mrescons, exact=True, fletcher32=True)  # fillvalue=''
-		# #
-		# # rescons str to the index mapping
-		# self.irescons = {s: i for i, s in enumerate(self.mrescons)}
-
-		# self.queue = None  # Note: the multiprocess queue is created in the enter blocks
-		# # The storage is not operational until the queue is created
-		# # Note: a shared value for the active state is sufficient, exact synchronization is not required
-		# self._active = Value('B', False, lock=False)
-		# self._persister = None
-
 	def dataset(self, smeta, metric):
 		"""Fetch dataset by the metadata and metric name
 
@@ -539,97 +472,148 @@ class QualitySaver(object):
 		# 	'Unexpected type of the serialization meta data ({}) or metric name({}) '
 		# 	.format(type(smeta).__name__, type(metric).__name__))
 
+		# Fetch the already opened dataset if any
+		dskey = (smeta.group, smeta.measure, metric, smeta.ulev)
+		qmdata = self._dscache.get(dskey)
+		if qmdata is not None:
+			return qmdata
+
 		# Construct dataset name based on the quality measure binary name and its metric name
-		# (in case of multiple metrics are evaluated by the executing app)
-		dsname = smeta.measure if not metric else _PREFMETR.join((smeta.measure, metric))
-		if smeta.ulev:
-			dsname += SUFULEV
-		#print('> dsname: {}, metric: {}, mval: {}; location: {}'.format(dsname, metric, mval, smeta))
-		dsname += _EXTQDATASET
+		# (in case of multiple metrics are evaluated by the executing app).
+		# Note: the same names are used in the groups of all algorithms and networks, so they are memoized
+		dnkey = dskey[1:]
+		dsname = self._dsnames.get(dnkey)
+		if dsname is None:
+			dsname = smeta.measure if not metric else _PREFMETR.join((smeta.measure, metric))
+			if smeta.ulev:
+				dsname += SUFULEV
+			#print('> dsname: {}, metric: {}, mval: {}; location: {}'.format(dsname, metric, mval, smeta))
+			dsname += _EXTQDATASET
+			self._dsnames[dnkey] = dsname
 		# Open or create the required dataset
 		qmgroup = self.storage[smeta.group]
 		# qmdata = qmgroup.create_dataset(dsname, shape=(nins, nshf, nlev, QMSRUNS.get(smeta.measure, 1)),
 		# 	# 32-bit floating number, checksum (fletcher32), "exact" used to require both shape and type to match exactly
 		# 	dtype='f4', exact=True, fletcher32=True, fillvalue=np.float32(np.nan), track_times=True)
-		qmdata = None
 		try:
 			# Note: the out of bound values are omitted in case of update
 			qmdata = qmgroup[dsname]
 		except KeyError:
 			# Such dataset does not exist, create it
-			nins = qmgroup.attrs[SATTRNINS]
-			nshf = qmgroup.attrs[SATTRNSHF]
-			nlev = 1 if smeta.ulev or smeta.ppeval else qmgroup.parent.attrs[SATTRNLEV]
-			qmdata = qmgroup.create_dataset(dsname, shape=(nins, nshf, nlev, QMSRUNS.get(smeta.measure, 1)),
-				# 32-bit floating number, checksum (fletcher32)
-				dtype='f4', fletcher32=True, fillvalue=np.float32(np.nan), track_times=True)
+			# Note: the dimension attributes are stored as arrays of size 1, so fetch their scalar values
+			nins = scalar(qmgroup.attrs[SATTRNINS])
+			nshf = scalar(qmgroup.attrs[SATTRNSHF])
+			nlev = 1 if smeta.ulev or smeta.ppeval else scalar(qmgroup.parent.attrs[SATTRNLEV])
+			shape = (nins, nshf, nlev, QMSRUNS.get(smeta.measure, 1))
+			# Note: h5py rejects the chunks exceeding the fixed dataset shape
+			chunks = None if self._chunks is None else tuple(min(c, s) for c, s in zip(self._chunks, shape))
+			qmdata = qmgroup.create_dataset(dsname, shape=shape, chunks=chunks,
+				# 16-bit floating number (sufficient for the measures in [-0.5, 1] with ~1E-3 precision)
+				dtype='f2', fillvalue=np.float16(np.nan), track_times=True, **self._cfilter)
 			# NOTE: Numpy NA (not available) instead of NaN (not a number) might be preferable
 			# but it requires latest NumPy versions.
 			# https://www.numpy.org/NA-overview.html
 			# Numpy NAs (https://docs.scipy.org/doc/numpy-1.14.0/neps/missing-data.html):
 			# np.NA,  dtype='NA[f4]', dtype='NA', np.dtype('NA[f4,NaN]')
+		self._dscache[dskey] = qmdata
 		return qmdata
 
 	def __call__(self, qm):
-		"""Worker process function to save data to the persistent storage
+		"""Save data to the persistent storage
+
+		The values are buffered per dataset and written to the storage in batches
+		on the buffer overflow, flush() or the context exit.
 
 		qm: QEntry  - quality metric (data and metadata) to be saved into the persistent storage
 		"""
 		assert isinstance(qm, QEntry), 'Unexpected type of the quality entry: ' + type(qm).__name__
-		# Save data elements (entries)
-		for metric, mval in viewitems(qm.data):
-			try:
-				# Metric is str (or can be unicode in Python2)
-				assert isinstance(mval, float), 'Invalid data type, metric: {}, value: {}'.format(
-					type(metric).__name__, type(mval).__name__)
-				# Save data to the storage
-				# with syncstorage.get_lock():
-				# print('>> [{},{},{},{}]{}: {}'.format(qm.smeta.iins, qm.smeta.ishf, qm.smeta.ilev, qm.smeta.irun,
-				# 	'' if not qm.smeta.ulev else 'u', mval))
-				self.dataset(qm.smeta, metric)[qm.smeta.iins, qm.smeta.ishf, qm.smeta.ilev,qm.smeta.irun] = mval
-			except Exception as err:  #pylint: disable=W0703;  # queue.Empty as err:  # TypeError (HDF5), KeyError
-				print('ERROR, saving of {} into {}{}{}[{},{},{},{}] failed: {}. {}'.format(
-					mval, qm.smeta.measure, '' if not metric else _PREFMETR + metric,
-					'' if not qm.smeta.ulev else SUFULEV, qm.smeta.iins, qm.smeta.ishf,
-					qm.smeta.ilev, qm.smeta.irun, err, traceback.format_exc(5)), file=sys.stderr)
-			# alg = apps.require_dataset('Pscan01'.encode(),shape=(0,),dtype=h5py.special_dtype(vlen=bytes),chunks=(10,),maxshape=(None,),fletcher32=True)
-			# 	# Allocate chunks of 10 items starting with empty dataset and with possibility
-			# 	# to resize up to 500 items (params combinations)
-			# 	self.apps[app] = appsdir.require_dataset(app, shape=(0,), dtype=h5py.special_dtype(vlen=_h5str)
-			# 		, chunks=(10,), maxshape=(500,))  # , maxshape=(None,), fletcher32=True
-			# self.evals = self.storage.require_group('evals')  # Quality evaluations dir (group)
+		smeta = qm.smeta
+		data = qm.data
+		# Unpack the dataset indices once for all metrics of the entry
+		_group, _measure, _ulev, iins, ishf, ilev, irun, _ppeval = smeta
+		idx = (ishf, ilev, irun)
+		# Most of the quality measures yield a single metric, which is buffered without the items iteration
+		if len(data) == 1:
+			metric, mval = next(iter(viewitems(data)))
+			self.__buffer(smeta, metric, mval, iins, idx)
+		else:
+			# Buffer data elements (entries)
+			for metric, mval in viewitems(data):
+				self.__buffer(smeta, metric, mval, iins, idx)
+		self._npending += len(data)
+		if self._npending >= self.PENDING_MAX:
+			self.flush()
+
+	def __buffer(self, smeta, metric, mval, iins, idx):
+		"""Buffer the metric value to be written to the storage, reporting failures
+
+		smeta: SMeta  - serialization meta data
+		metric: str  - metric name
+		mval: float  - metric value
+		iins: uint  - index of the network instance in the dataset
+		idx: (ishf: uint, ilev: uint, irun: uint)  - index of the value within the network instance
+		"""
+		try:
+			# Metric is str (or can be unicode in Python2)
+			assert isinstance(mval, float), 'Invalid data type, metric: {}, value: {}'.format(
+				type(metric).__name__, type(mval).__name__)
+			self._pending.setdefault(self.dataset(smeta, metric), []).append((smeta, metric, mval, iins, idx))
+		except Exception as err:  #pylint: disable=W0703;  # TypeError (HDF5), KeyError
+			self.__reportFailure(smeta, metric, mval, err)
+
+	def flush(self):
+		"""Write the buffered values to the storage
+
+		The pending values of each dataset are grouped by the network instance, and only
+		the touched instances are read and written (once for all their values), which omits
+		the per-value processing of the HDF5 chunks (including their checksum evaluation).
+		A single value of the instance is written to its cell directly.
+		"""
+		for qmdata, vals in viewitems(self._pending):
+			ivals = {}  # Pending values grouped by the instance index
+			for val in vals:
+				ivals.setdefault(val[3], []).append(val)
+			for iins, vals in viewitems(ivals):
+				try:
+					if len(vals) == 1:
+						_smeta, _metric, mval, _iins, (ishf, ilev, irun) = vals[0]
+						qmdata[iins, ishf, ilev, irun] = mval
+						continue
+					dsvals = qmdata[iins]  # Values of all shuffles, levels and runs of the instance
+					for smeta, metric, mval, _iins, idx in vals:
+						try:
+							dsvals[idx] = mval
+						except IndexError as err:
+							self.__reportFailure(smeta, metric, mval, err)
+					qmdata[iins] = dsvals
+				except Exception as err:  #pylint: disable=W0703;  # IndexError, TypeError (HDF5), OSError
+					for smeta, metric, mval, _iins, _idx in vals:
+						self.__reportFailure(smeta, metric, mval, err)
+		self._pending.clear()
+		self._npending = 0
+
+	@staticmethod
+	def __reportFailure(smeta, metric, mval, err):
+		"""Report failed saving of the metric value
+
+		smeta: SMeta  - serialization meta data
+		metric: str  - metric name
+		mval: float  - metric value
+		err: Exception  - occurred error
+		"""
+		print('ERROR, saving of {} into {}{}{}[{},{},{},{}] failed: {}. {}'.format(
+			mval, smeta.measure, '' if not metric else _PREFMETR + metric, '' if not smeta.ulev else SUFULEV
+			, smeta.iins, smeta.ishf, smeta.ilev, smeta.irun, err, traceback.format_exc(5)), file=sys.stderr)
 
 	def __del__(self):
 		"""Destructor"""
-		# self._active.value = False
-		# try:
-		# 	if self.queue is not None:
-		# 		try:
-		# 			if not self.queue.empty():
-		# 				print('WARNING, terminating the persistency layer with {} queued data entries, call stack: {}'
-		# 					.format(self.queue.qsize(), traceback.format_exc(5)), file=sys.stderr)
-		# 		except OSError:   # The queue has been already closed from another process
-		# 			pass
-		# 		self.queue.close()  # No more data can be put in the queue
-		# 		self.queue.join_thread()
-		# 	if self._persister is not None:
-		# 		self._persister.join(0)  # Note: timeout is 0 to avoid destructor blocking
-		# finally:
-		# 	if self.storage is None:
-		# 		return
-		# 	with self.storage.get_lock():
-		# 		if self.storage.value is not None:
-		# 			self.storage.close()
 		if self.storage is not None:
+			if self._pending:
+				self.flush()
 			self.storage.close()
 
 	def __enter__(self):
-		# 	"""Context entrence"""
-		# 	self.queue = Queue(self.QUEUE_SIZEMAX)  # Qulity measures persistence queue, data pool
-		# 	self._active.value = True
-		# 	# __datasaver(qsqueue, active, timeout=None, latency=2.)
-		# 	self._persister = Process(target=self.__datasaver, args=(self.queue, self.storage, self._active, self.timeout))
-		# 	self._persister.start()
+		"""Context entrence"""
 		return self
 
 	def __exit__(self, etype, evalue, tracebk):
@@ -639,20 +623,85 @@ class QualitySaver(object):
 		evalue  - exception value
 		tracebk  - exception traceback
 		"""
-		# 	self._active.value = False
-		# 	try:
-		# 		self.queue.close()  # No more data can be put in the queue
-		# 		self.queue.join_thread()
-		# 		self._persister.join(None if self.timeout is None else self.timeout - self._tstart)
-		# 	finally:
-		# 		with self.storage.get_lock():
-		# 			if self.storage.value is not None:
-		# 				self.storage.value.flush()  # Allow to reuse the instance in several context managers
-		# 	# Note: the exception (if any) is propagated if True is not returned here
+		# Note: the exception (if any) is propagated if True is not returned here
 		if self.storage is not None:
+			self.flush()
 			self.storage.flush()  # Allow to reuse the instance in several context managers
 
 
+def _relpath(path, basedir):
+	"""Relative path to the specified base dir prefixed with './'
+
+	Note: without './' relpath args do not work properly for the binaries located in the current dir
+
+	path: str  - target path
+	basedir: str  - base directory
+	"""
+	return './' + os.path.relpath(path, basedir)
+
+
+def _qmpaths(algname, basenetp, measurep, workdir):
+	"""Memoized invariant paths and exectime arguments of the quality measure jobs
+
+	algname: str  - algorithm name
+	basenetp: str  - base network name including the path id
+	measurep: str  - quality measure suffixed with its parameters
+	workdir: str  - working directory of the quality measure
+
+	return
+		logsdir: str  - directory of the logs relative to the root dir of the benchmark
+		xtimebin: str  - path of the exectime binary relative to the workdir
+		xtimeopt: str  - exectime output option: path of the resource consumption profile relative to the workdir
+		xtimesect: str  - exectime section option (the measure name)
+	"""
+	key = (algname, basenetp, measurep, workdir)
+	paths = _QMPATHS.get(key)
+	if paths is None:
+		# Note: relpath(UTILDIR + 'exectime') -> 'exectime' does not work, it requires leading './'
+		paths = (''.join((RESDIR, algname, '/', QMSDIR, basenetp, '/')), _relpath(UTILDIR + 'exectime', workdir)
+			, '-o=' + _relpath(''.join((RESDIR, algname, '/', QMSDIR, measurep, EXTRESCONS)), workdir)
+			, '-s=/etime_' + measurep)
+		_QMPATHS[key] = paths
+	return paths
+
+
+def _inprelpath(inpfpath, workdir):
+	"""Memoized relative path of the input dataset, which is evaluated against all the clusterings
+
+	inpfpath: str  - input dataset file path (ground-truth / input network)
+	workdir: str  - working directory of the quality measure
+	"""
+	key = (inpfpath, workdir)
+	path = _INPRELPATHS.get(key)
+	if path is None:
+		path = _relpath(inpfpath, workdir)
+		_INPRELPATHS[key] = path
+	return path
+
+
+def _inpfsize(inpfpath):
+	"""Memoized size of the input dataset in bytes, which is evaluated against all the clusterings
+
+	inpfpath: str  - input dataset file path (ground-truth / input network)
+	"""
+	size = _INPSIZES.get(inpfpath)
+	if size is None:
+		size = os.path.getsize(inpfpath)
+		_INPSIZES[inpfpath] = size
+	return size
+
+
+def _checkExecArgs(execpool, save, smeta, cfpath, inpfpath, timeout, seed, task):
+	"""Validate arguments of the quality measure executor (omitted in the optimized mode: python -O)"""
+	assert execpool and callable(save) and isinstance(smeta, SMeta
+		) and isinstance(cfpath, str) and isinstance(inpfpath, str) and (
+		seed is None or isinstance(seed, int)) and (task is None or isinstance(task, Task)), (
+		'Invalid arguments, execpool type: {}, save() type: {}, smeta type: {}, cfpath type: {},'
+		' inpfpath type: {}, timeout: {}, seed: {}, task type: {}'.format(
+		type(execpool).__name__, type(save).__name__, type(smeta).__name__, type(cfpath).__name__,
+		type(inpfpath).__name__, timeout, seed, type(task).__name__))
+
+
 def metainfo(afnmask=None, intrinsic=False, multirun=1):
 	"""Set some meta information for the executing evaluation measures
 
@@ -662,14 +711,18 @@ def metainfo(afnmask=None, intrinsic=False, multirun=1):
 	multirun: uint8, >= 1  - perform multiple runs of this stochastic quality measure
 	"""
 
+	assert (afnmask is None or isinstance(afnmask, AffinityMask)) and multirun >= 1 and isinstance(multirun, int), (
+		'Invalid arguments, affinity mask type: {}, multirun: {}'.format(type(afnmask).__name__, multirun))
+	# Save only quality measures with non-default affinity
+	if afnmask is not None and afnmask.afnstep == 1:
+		afnmask = None
+
 	# Note: the metrics producing by the measure can be defined by the execution arguments
 	# metrics: list(str)  - quality metrics producing by the measure
 	def decor(func):
 		"""Decorator returning the original function"""
-		assert (afnmask is None or isinstance(afnmask, AffinityMask)) and multirun >= 1 and isinstance(multirun, int), (
-			'Invalid arguments, affinity mask type: {}, multirun: {}'.format(type(afnmask).__name__, multirun))
 		# QMSRAFN[funcToAppName(func)] = afnmask
-		if afnmask is not None and afnmask.afnstep != 1:  # Save only quality measures with non-default affinity
+		if afnmask is not None:
 			QMSRAFN[func] = afnmask
 		if intrinsic:
 			QMSINTRIN.add(func)
@@ -681,25 +734,6 @@ def metainfo(afnmask=None, intrinsic=False, multirun=1):
 	return decor
 
 
-# def saveQuality(qsqueue, qentry):
-# 	"""Save quality entry int the Quality Saver queue
-#
-# 	Args:
-# 		qsqueue: Queue  - quality saver queue
-# 		qentry: QEntry  - quality entry to be saved
-# 	"""
-# 	# Note: multiprocessing Queue is not a Python class, it is a function creating a proxy object
-# 	assert isinstance(qentry, QEntry), ('Unexpected type of the arguments, qsqueue: {}, qentry: {}'
-# 		.format(type(qsqueue).__name__, type(qentry).__name__))
-# 	try:
-# 		# Note: evaluators should not be delayed in the main thread
-# 		# Anyway qsqueue is buffered and in theory serialization
-# 		qsqueue.put_nowait(qentry)
-# 	except queue.Full as err:
-# 		print('WARNING, the quality entry ({}) saving is cancelled because of the busy serialization queue: {}'
-# 			.format(str(qentry), err, file=sys.stderr))
-
-
 # Note: default AffinityMask is 1 (logical CPUs, i.e. hardware threads)
 def qmeasure(qmapp, workdir=UTILDIR):
 	"""Quality Measure exutor decorator
@@ -707,6 +741,7 @@ def qmeasure(qmapp, workdir=UTILDIR):
 	qmapp: str  - quality measure application (binary) name (located in the ./utils dir)
 	workdir: str  - current working directory from which the quality measure binare is called
 	"""
+	qmexec = './' + qmapp  # Quality measure executable relative to the workdir, formed once for all the jobs
 
 	def wrapper(qmsaver):  # Actual decorator for the qmsaver func(Job)
 		"""Actual decorator of the quality measure parcing saving function
@@ -743,54 +778,47 @@ def qmeasure(qmapp, workdir=UTILDIR):
 
 			return jobsnum: uint  - the number of started jobs
 			"""
-			# qsqueue: Queue  - multiprocess queue of the quality results saver (persister)
-			assert execpool and callable(save) and isinstance(smeta, SMeta
-			) and isinstance(cfpath, str) and isinstance(inpfpath, str) and (seed is None or isinstance(seed, int)
-			) and (task is None or isinstance(task, Task)), (
-			'Invalid arguments, execpool type: {}, save() type: {}, smeta type: {}, cfpath type: {},'
-			' inpfpath type: {}, timeout: {}, seed: {}, task type: {}'.format(
-			type(execpool).__name__, type(save).__name__, type(smeta).__name__, type(cfpath).__name__,
-			type(inpfpath).__name__, timeout, seed, type(task).__name__))
+			if __debug__:
+				_checkExecArgs(execpool, save, smeta, cfpath, inpfpath, timeout, seed, task)
 
 			# The task argument name already includes: QMeasure / BaseNet#PathId / Alg,
 			# so here smeta parts and qparams should form the job name for the full identification of the executing job
 			# Note: HDF5 uses Unicode for the file name and ASCII/Unicode for the group names
 			algname, basenetp = smeta.group[1:].split('/')  # Omit the leading '/'; basenetp includes pathid
 			# Note that evaluating file name might significantly differ from the network name, for example `tp<id>` produced by OSLOM
-			cfname = os.path.splitext(os.path.split(cfpath)[1])[0]  # Evaluating file name (without the extension)
-			measurep = SEPPARS.join((smeta.measure, _SEPQARGS.join(qparams)))  # Quality measure suffixed with its parameters
+			# Evaluating file name (without the extension), parsed without the os.path calls
+			cfname = cfpath.rpartition('/')[2]
+			cfbase = cfname.rpartition('.')[0]
+			if cfbase.strip('.'):  # Note: the leading dots do not denote the extension
+				cfname = cfbase
+			# Note: measurep is interned since it is shared by all the evaluating clusterings being the jobs category
+			measurep = intern(SEPPARS.join((smeta.measure, _SEPQARGS.join(qparams))))  # Quality measure suffixed with its parameters
 			taskname = _SEPQMS.join((cfname, measurep))
 
 			# Evaluate relative size of the clusterings
 			# Note: xmeasures takes inpfpath as the ground-truth clustering, so the asym parameter is not actual here
-			clsize = os.path.getsize(cfpath) + os.path.getsize(inpfpath)
+			clsize = os.path.getsize(cfpath) + _inpfsize(inpfpath)
 
-			# Define path to the logs relative to the root dir of the benchmark
-			logsdir = ''.join((RESDIR, algname, '/', QMSDIR, basenetp, '/'))
+			# Define path to the logs relative to the root dir of the benchmark and the paths relative to the workdir
+			logsdir, xtimebin, xtimeopt, xtimesect = _qmpaths(algname, basenetp, measurep, workdir)
 			# Note: backup is not performed since it should be performed at most once for all logs in the logsdir
 			# (staticExec could be used) and only if the logs are rewriting but they are appended.
 			# The backup is not convenient here for multiple runs on various networks to get aggregated results
-			if not os.path.exists(logsdir):
-				os.makedirs(logsdir)
+			if logsdir not in _LOGSDIRS:
+				if not os.path.exists(logsdir):
+					os.makedirs(logsdir)
+				_LOGSDIRS.add(logsdir)
 			errfile = taskname.join((logsdir, EXTERR))
 			logfile = taskname.join((logsdir, EXTLOG))
 
-			# Note: without './' relpath args do not work properly for the binaries located in the current dir
-			relpath = lambda path: './' + os.path.relpath(path, workdir)  # Relative path to the specified basedir
-			# Evaluate relative paths
-			# xtimebin = './exectime'  # Note: relpath(UTILDIR + 'exectime') -> 'exectime' does not work, it requires leading './'
-			xtimebin = relpath(UTILDIR + 'exectime')
-			xtimeres = relpath(''.join((RESDIR, algname, '/', QMSDIR, measurep, EXTRESCONS)))
-
 			# The task argument name already includes: QMeasure / BaseNet#PathId / Alg
-			# Note: xtimeres does not include the base network name, so it should be included into the listed taskname,
-			args = [xtimebin, '-o=' + xtimeres, ''.join(('-n=', basenetp, SEPNAMEPART, cfname)),
-				'-s=/etime_' + measurep, './' + qmapp]
+			# Note: xtimeopt (resource consumption profile) does not include the base network name, so it should be included into the listed taskname,
+			args = [xtimebin, xtimeopt, ''.join(('-n=', basenetp, SEPNAMEPART, cfname)), xtimesect, qmexec]
 			if qparams:
 				args += qparams
 			# Note: use first the ground-truth or network file and then the clustering file to perform sync correctly
 			# for the xmeaseres (gecmi and onmi select the most reasonable direction automatically)
-			args += (relpath(inpfpath), relpath(cfpath))
+			args += (_inprelpath(inpfpath, workdir), _relpath(cfpath, workdir))
 			job = Job(name=taskname, workdir=workdir, args=args, timeout=timeout,
 				ondone=qmsaver, params={'save': save, 'smeta': smeta},
 				# Note: poutlog indicates the output log file that should be formed from the PIPE output
@@ -802,8 +830,13 @@ def qmeasure(qmapp, workdir=UTILDIR):
 				# Note: metric name is quality measure app dependant name, which can be fetched either calling the measure app or reading the resulting log
 				# save.dataset(qm.smeta, metric)[qm.smeta.iins, qm.smeta.ishf, qm.smeta.ilev,qm.smeta.irun]
 				try:
-					with open(logfile) as fres:
-						job.pipedout = ''.join(fres.readlines()[save.ntail:])  # We are interested only in the last 2ntail lines
+					# Note: the log accumulates outputs of all the evaluations (runs), but only the last
+					# ntail lines are interested, so only the tail of the file is read
+					with open(logfile, 'rb') as fres:
+						fres.seek(0, os.SEEK_END)
+						fres.seek(max(fres.tell() - _LOGTAILSIZE, 0))
+						# Note: the first line can be truncated including the multibyte symbol
+						job.pipedout = fres.read().decode('utf-8', 'ignore')
 					qmsaver(job)
 				except Exception as err:  #pylint: disable=W0703
 					print('ERROR, quality measure saving is failed from the file {}: {}. Discarded. {}'.format(
@@ -821,6 +854,36 @@ def qmeasure(qmapp, workdir=UTILDIR):
 	return wrapper
 
 
+def _tailLines(text, num):
+	"""Fetch the last lines of the text omitting the trailing whitespaces
+
+	The lines are located from the end of the text without splitting all the text lines.
+
+	text: str  - text to be processed
+	num: uint  - the max number of the fetching lines
+
+	return  list(str)  - up to num last lines of the text
+
+	>>> _tailLines('a\\nb\\n\\nc \\n', 2)
+	['', 'c']
+	>>> _tailLines(' \\n', 2)
+	[]
+	"""
+	text = text.rstrip()
+	lines = []
+	if not text:
+		return lines
+	end = len(text)
+	while len(lines) < num:
+		beg = text.rfind('\n', 0, end) + 1
+		lines.append(text[beg:end].rstrip('\r'))
+		if not beg:
+			break
+		end = beg - 1
+	lines.reverse()
+	return lines
+
+
 def qmsaver(job):
 	"""Default quality measure parser and serializer, used as Job ondone() callback
 
@@ -856,49 +919,39 @@ def qmsaver(job):
 	#
 	# Define the number of strings in the output counting the number of words in the last string
 	# Identify index of the last non-empty line
-	qmres = job.pipedout.rstrip().splitlines()[save.ntail:]  # Fetch last 2 non-empty lines as a list(str)
+	qmres = _tailLines(job.pipedout, -save.ntail)  # Fetch last 2 non-empty lines as a list(str)
+	if not qmres:
+		return
 	# print('Value line: {}, len: {}, sym1: {}'.format(qmres[-1], len(qmres[-1]), ord(qmres[-1][0])))
 	if len(qmres[-1].split(None, 1)) == 1:
 		# Metric name is None (the same as binary name) if not specified explicitly
 		name = None if len(qmres) == 1 else qmres[0].split(None, 1)[0].rstrip(':')  # Omit ending ':' if any
 		val = qmres[-1]  # Note: index -1 corresponds to either 0 or 1
-		# qsqueue.put(QEntry(smeta, {name: toFloat(val)}))
-		# # , block=True, timeout=None if not timeout else max(0, timeout - (time.perf_counter() - job.tstart)))
-		# saveQuality(qsqueue, QEntry(smeta, {name: toFloat(val)}))
 		# print('> Parsed data (single) from "{}", name: {}, val: {}; qmres: {}'.format(
 		# 	' '.join(('' if len(qmres) == 1 else qmres[0], qmres[-1])), name, val, qmres))
-		save(QEntry(smeta, {name: toFloat(val)}))
-		# except queue.Full as err:
-		# 	print('WARNING, results serialization discarded by the Job "{}" timeout'.format(job.name))
+		val = toFloat(val)
+		if val is not None:
+			save(QEntry(smeta, {name: val}))
 		return
 	# Parse multiple names of the metrics and their values from the last string:  <metric>: <value>{,;} ...
-	# Note: index -1 corresponds to either 0 or 1
-	metrics = [qmres[-1]]
 	# Example of the parsing line: "[F1_labels]: ]<val> (Precision: <val>, ...)"
-	for sep in ',;(':
-		smet = []
-		for m in metrics:
-			smet.extend(m.split(sep))
-		metrics = smet
+	# Note: index -1 corresponds to either 0 or 1
 	data = {}  # Serializing data
-	# Note: the first value may lack the preceeding name
-	mt0 = metrics[0].split(':', 1)
-	if len(mt0) >= 2:
-		name, val = mt0.split(':', 1)
-	else:
-		# Metric name is None (the same as binary name) if not specified explicitly
-		name = None if len(qmres) == 1 else qmres[0].split(None, 1)[0].rstrip(':')  # Omit ending ':' if any
-		val = mt0[0]
-	data[name.lstrip()] = toFloat(val.rstrip(' \t)'))
-	# print('> Parsed data from "{}", name: {}, val: {}'.format(mt, name.lstrip(), data[name.lstrip()]))
-	# Parse remained values
-	if len(metrics) >= 2:
-		for mt in metrics[1:]:
-			name, val = mt.split(':', 1)
-			data[name.lstrip()] = toFloat(val.rstrip(' \t)'))
-			# print('> Parsed data from "{}", name: {}, val: {}'.format(mt, name.lstrip(), data[name.lstrip()]))
+	for i, mt in enumerate(_RESEPMETRS.split(qmres[-1])):
+		mnv = _REMETRVAL.match(mt)
+		if mnv is None or (mnv.group(1) is None and i):
+			print('ERROR, invalid metric format of the job "{}" is discarded: {}'.format(job.name, mt), file=sys.stderr)
+			continue
+		name, val = mnv.groups()
+		if name is None:
+			# Note: the first value may lack the preceeding name
+			# Metric name is None (the same as binary name) if not specified explicitly
+			name = None if len(qmres) == 1 else qmres[0].split(None, 1)[0].rstrip(':')  # Omit ending ':' if any
+		val = toFloat(val)
+		if val is not None:
+			data[name] = val
+		# print('> Parsed data from "{}", name: {}, val: {}'.format(mt, name, val))
 	if data:
-		# saveQuality(qsqueue, QEntry(smeta, data))
 		save(QEntry(smeta, data))
 
 
@@ -1091,56 +1144,57 @@ def execImeasures(execpool, save, smeta, qparams, cfpath, inpfpath, asym=False,
 		# TODO: implement early exit on qualsaver.valueExists(smeta, metrics),
 		# where metrics are provided by the quality measure app by it's qparams
 		staticTrace('Imeasures', 'Omission of the existent results is not supported yet')
-	# qsqueue: Queue  - multiprocess queue of the quality results saver (persister)
-	assert execpool and callable(save) and isinstance(smeta, SMeta
-		) and isinstance(cfpath, str) and isinstance(inpfpath, str) and (
-		seed is None or isinstance(seed, int)) and (task is None or isinstance(task, Task)), (
-		'Invalid arguments, execpool type: {}, save() type: {}, smeta type: {}, cfpath type: {},'
-		' inpfpath type: {}, timeout: {}, seed: {}, task type: {}'.format(
-		type(execpool).__name__, type(save).__name__, type(smeta).__name__, type(cfpath).__name__,
-		type(inpfpath).__name__, timeout, seed, type(task).__name__))
+	if __debug__:
+		_checkExecArgs(execpool, save, smeta, cfpath, inpfpath, timeout, seed, task)
 
 	# The task argument name already includes: QMeasure / BaseNet#PathId / Alg,
 	# so here smeta parts and qparams should form the job name for the full identification of the executing job
 	# Note: HDF5 uses Unicode for the file name and ASCII/Unicode for the group names
 	algname, basenetp = smeta.group[1:].split('/')  # Omit the leading '/'; basenetp includes pathid
 	# Note that evaluating file name might significantly differ from the network name, for example `tp<id>` produced by OSLOM
-	cfname = os.path.splitext(os.path.split(cfpath)[1])[0]  # Evaluating file name (without the extension)
-	measurep = SEPPARS.join((smeta.measure, _SEPQARGS.join(qparams)))  # Quality measure suffixed with its parameters
+	# Evaluating file name (without the extension), parsed without the os.path calls
+	cfname = cfpath.rpartition('/')[2]
+	cfbase = cfname.rpartition('.')[0]
+	if cfbase.strip('.'):  # Note: the leading dots do not denote the extension
+		cfname = cfbase
+	# Note: measurep is interned since it is shared by all the evaluating clusterings being the jobs category
+	measurep = intern(SEPPARS.join((smeta.measure, _SEPQARGS.join(qparams))))  # Quality measure suffixed with its parameters
 	taskname = _SEPQMS.join((cfname, measurep))
 
 	# Evaluate relative size of the clusterings
 	# Note: xmeasures takes inpfpath as the ground-truth clustering, so the asym parameter is not actual here
-	clsize = os.path.getsize(cfpath) + os.path.getsize(inpfpath)
+	clsize = os.path.getsize(cfpath) + _inpfsize(inpfpath)
 
-	# Define path to the logs relative to the root dir of the benchmark
-	logsdir = ''.join((RESDIR, algname, '/', QMSDIR, basenetp, '/'))
+	# Define path to the logs relative to the root dir of the benchmark and the paths relative to the workdir
+	logsdir, xtimebin, xtimeopt, xtimesect = _qmpaths(algname, basenetp, measurep, workdir)
 	# Note: backup is not performed since it should be performed at most once for all logs in the logsdir
 	# (staticExec could be used) and only if the logs are rewriting but they are appended.
 	# The backup is not convenient here for multiple runs on various networks to get aggregated results
-	if not os.path.exists(logsdir):
-		os.makedirs(logsdir)
+	if logsdir not in _LOGSDIRS:
+		if not os.path.exists(logsdir):
+			os.makedirs(logsdir)
+		_LOGSDIRS.add(logsdir)
 	errfile = taskname.join((logsdir, EXTERR))
 	logfile = taskname.join((logsdir, EXTLOG))
 
-	# Note: without './' relpath args do not work properly for the binaries located in the current dir
-	relpath = lambda path: './' + os.path.relpath(path, workdir)  # Relative path to the specified basedir
-	# Evaluate relative paths
-	# xtimebin = './exectime'  # Note: relpath(UTILDIR + 'exectime') -> 'exectime' does not work, it requires leading './'
-	xtimebin = relpath(UTILDIR + 'exectime')
-	xtimeres = relpath(''.join((RESDIR, algname, '/', QMSDIR, measurep, EXTRESCONS)))
-
 	# The task argument name already includes: QMeasure / BaseNet#PathId / Alg
-	# Note: xtimeres does not include the base network name, so it should be included into the listed taskname,
-	args = [xtimebin, '-o=' + xtimeres, ''.join(('-n=', basenetp, SEPNAMEPART, cfname)),
-		'-s=/etime_' + measurep, './daoc']
-	for qp in qparams:
-		if qp.startswith('-e'):  #  Append filename of the evaluating clsutering
-			qp = '='.join((qp, relpath(cfpath)))
-		args.append(qp)
+	# Note: xtimeopt (resource consumption profile) does not include the base network name, so it should be included into the listed taskname,
+	args = [xtimebin, xtimeopt, ''.join(('-n=', basenetp, SEPNAMEPART, cfname)), xtimesect, './daoc']
+	# Append filename of the evaluating clsutering to the evaluation options (-e), whose indices are memoized
+	# Note: measurep is fixed per the measure parameters and is already formed (interned)
+	eids = _QPEVALIDS.get(measurep)
+	if eids is None:
+		eids = tuple(i for i, qp in enumerate(qparams) if qp.startswith('-e'))
+		_QPEVALIDS[measurep] = eids
+	iqp = len(args)  # Index of the first quality measure parameter in the args
+	args.extend(qparams)
+	if eids:
+		cfrpath = _relpath(cfpath, workdir)
+		for i in eids:
+			args[iqp + i] = '='.join((args[iqp + i], cfrpath))
 	# Note: use first the ground-truth or network file and then the clustering file to perform sync correctly
 	# for the xmeaseres (gecmi and onmi select the most reasonable direction automatically)
-	args.append(relpath(inpfpath))
+	args.append(_inprelpath(inpfpath, workdir))
 	# print('> Starting Xmeasures with the args: ', args)
 	# print('> Starting {} for: {}, {}'.format('Imeasures', args[-2], args[-1]))
 	execpool.execute(Job(name=taskname, workdir=workdir, args=args, timeout=timeout,
@@ -1400,7 +1454,7 @@ def aggeval(aggevals, nets, qaggopts, exclude, qmsname, revalue=False, maxins=0)
 						#	.format(fltout, aflt, match))
 						continue
 				# Identify whether the quality measure dataset multilevel and has multiple runs:
-				# (iinst)[(ishuf)][(ilev)][(qmirun)]: float4
+				# (iinst)[(ishuf)][(ilev)][(qmirun)]: float2 (former float4)
 				i = 3
 				mrun = len(dmsr.shape) >= i + 1 and dmsr.shape[i] >= 2
 				i -= 1
@@ -1411,7 +1465,9 @@ def aggeval(aggevals, nets, qaggopts, exclude, qmsname, revalue=False, maxins=0)
 				avgsd.reset()
 				avgrshf.reset()  # Empty if all shuffles are successfully processed, otherwise the ratio of not NaNs
 				nansfavg.reset()
-				for iins, inst in enumerate(dmsr):
+				# Note: the values might be persisted as float16, so cast them to float32 to retain the accuracy
+				# of the aggregation (the whole dataset is fetched at once, which is also faster than per-row reads)
+				for iins, inst in enumerate(dmsr[()].astype(np.float32)):
 					if maxins and iins >= maxins:  # Note: iins indexing starts from 0, which corresponds to maxins = 1
 						break
 					if mshf:
@@ -69,6 +69,11 @@ from numbers import Number  # To verify that a variable is a number (int or floa
 # Consider time interface compatibility for Python before v3.3
 if not hasattr(time, 'perf_counter'):  #pylint: disable=C0413
 	time.perf_counter = time.time
+# Directory entries with the cached file type are available only since Python 3.5
+try:
+	from os import scandir
+except ImportError:
+	scandir = None
 
 from math import sqrt
 from multiprocessing import cpu_count  # Returns the number of logical CPU units (HW treads) if defined
@@ -354,6 +359,9 @@ class Params(object):
 		qrevalue  - revalue all values from scratch instead of leaving the existent values
 			and (evaluating and) adding only the non-existent (lacking values), makes sense
 			only if qupdate otherwise all values are computed anyway.
+		qcompress: str|None  - compression filter of the quality evaluation datasets: gzip, lzf, blosc or None
+		qchunks: tuple(uint, uint, uint, uint)|None  - chunk shape of the quality evaluation datasets
+			(instances, shuffles, levels, runs), automatic if None
 		datas: PathOpts  - list of datasets to be run with asym flag (asymmetric
 			/ symmetric links weights):
 			[PathOpts, ...] , where path is either dir or file [wildcard]
@@ -382,6 +390,8 @@ class Params(object):
 		self.qmeasures = None  # Evaluating quality measures with their parameters
 		self.qupdate = True
 		self.qrevalue = False
+		self.qcompress = 'gzip'
+		self.qchunks = None
 		self.datas = []  # Input datasets, list of PathOpts, where path is either dir or file wildcard
 		self.timeout = _TIMEOUT
 		self.algorithms = []
@@ -472,6 +482,24 @@ def parseParams(args):
 			elif arg.startswith('--quality-revalue'):
 				opts.qrevalue = True
 				continue
+			elif arg.startswith('--quality-compress'):
+				nend = len('--quality-compress')
+				if len(arg) <= nend + 1 or arg[nend] != '=':
+					raise ValueError('Unexpected argument: ' + arg)
+				opts.qcompress = arg[nend+1:]
+				if opts.qcompress == 'none':
+					opts.qcompress = None
+				elif opts.qcompress not in ('gzip', 'lzf', 'blosc'):
+					raise ValueError('Unexpected compression filter: ' + arg)
+				continue
+			elif arg.startswith('--quality-chunks'):
+				nend = len('--quality-chunks')
+				if len(arg) <= nend + 1 or arg[nend] != '=':
+					raise ValueError('Unexpected argument: ' + arg)
+				opts.qchunks = tuple(int(v) for v in arg[nend+1:].split(','))
+				if len(opts.qchunks) != 4 or min(opts.qchunks) <= 0:
+					raise ValueError('Unexpected chunk shape: ' + arg)
+				continue
 			elif arg.startswith('--runtimeout'):
 				nend = len('--runtimeout')
 				if len(arg) <= nend + 1 or arg[nend] != '=':
@@ -1782,7 +1810,17 @@ def clnames(net, odir, alg, pathidsuf=''):
 	# for clp in glob.iglob(''.join((cbdir, clname, '/*'))):
 	# 	if not os.path.isfile(clp):
 	# 		print('> ERROR, target item is not an existent file: ', clp)
-	return ([clp for clp in glob.iglob(''.join((cbdir, clname, '/*'))) if os.path.isfile(clp)],
+	cldir = ''.join((cbdir, clname))
+	if scandir is not None:
+		# Note: the file type is cached by the dir entry (stat is not called for the regular files),
+		# hidden files are omitted as by the glob
+		try:
+			cfnames = [ent.path for ent in scandir(cldir) if not ent.name.startswith('.') and ent.is_file()]
+		except OSError:  # The clustering dir does not exist
+			cfnames = []
+	else:
+		cfnames = [clp for clp in glob.iglob(cldir + '/*') if os.path.isfile(clp)]
+	return (cfnames,
 		# Aggregated levels into the single clustering
 		None if not os.path.isfile(mrcl) else mrcl)
 
@@ -1822,7 +1860,7 @@ def gtpath(net, idir):
 
 
 def evalResults(qmsmodule, qmeasures, appsmodule, algorithms, datas, seed, exectime, timeout  #pylint: disable=W0613
-, evaltimeout=_EVALTIMEOUT, update=True, revalue=False):  #pylint: disable=W0613;  # , netnames=None
+, evaltimeout=_EVALTIMEOUT, update=True, revalue=False, compression='gzip', chunks=None):  #pylint: disable=W0613;  # , netnames=None
 	"""Run specified applications (clustering algorithms) on the specified datasets
 
 	qmsmodule: module  - module with quality measures definitions to be run; sys.modules[__name__]
@@ -1843,6 +1881,8 @@ def evalResults(qmsmodule, qmeasures, appsmodule, algorithms, datas, seed, exect
 	revalue: bool  - whether to revalue the existent results or omit such evaluations
 		calculating and saving only the absent values in the dataset,
 		actual only for the update flag set
+	compression: str|None  - compression filter of the created evaluation datasets: gzip, lzf, blosc or None
+	chunks: tuple(uint, uint, uint, uint)|None  - chunk shape of the created evaluation datasets, automatic if None
 	"""
 	# netnames: iterable(str)  - input network names with path id and without the base path,
 	# 	used to form meta data in the evaluation storage. Explicit specification is useful
@@ -1934,7 +1974,7 @@ def evalResults(qmsmodule, qmeasures, appsmodule, algorithms, datas, seed, exect
 	global _execpool
 	assert _execpool is None, 'The global execution pool should not exist'
 	# Prepare HDF5 evaluations store
-	with QualitySaver(seed=seed, update=update) as qualsaver:  # , nets=netnames
+	with QualitySaver(seed=seed, update=update, compression=compression, chunks=chunks) as qualsaver:  # , nets=netnames
 		# Validate algorithm HDF5 group attributes (nlev)
 		# alevs = {}  # The actual number of levels in each algorithm in the storage
 		try:
@@ -1959,13 +1999,15 @@ def evalResults(qmsmodule, qmeasures, appsmodule, algorithms, datas, seed, exect
 		# Sort qmeasures with their executables having affinity step = 1 in the end for the pop()
 		qmeas = sorted(zip(qmeasures, exeqms, (QMSRAFN.get(eq) for eq in exeqms)),
 			key=lambda qmea: 1 if qmea[2] is None else qmea[2].afnstep, reverse=True)
-		cqmes = []  # Currently processing qmes having the same affinity mask
+		cqmes = []  # Currently processing qmes having the same affinity mask: (qm, eq, intrin, runs)
 		# tasks = []  # All tasks
 		while qmeas:
 			afn = qmeas[-1][2]
 			del cqmes[:]
 			while qmeas and qmeas[-1][2] == afn:
-				cqmes.append(qmeas.pop()[:2])
+				qm, eq = qmeas.pop()[:2]
+				# Note: the measure registration attributes are fetched once per measure rather than per network
+				cqmes.append((qm, eq, eq in QMSINTRIN, QMSRUNS.get(qm[0], 1)))
 			if afn is None:  # Note: QMSRAFN contains mandatory values only for the non-default AffinityMask
 				afn = AffinityMask(1)
 
@@ -2109,7 +2151,7 @@ def evalResults(qmsmodule, qmeasures, appsmodule, algorithms, datas, seed, exect
 							# return jobsnum
 							continue
 
-						for i, (qm, eq) in enumerate(cqmes):
+						for i, (qm, eq, intrin, runs) in enumerate(cqmes):
 							# Append algortihm-indicating subtask: QMeasure / BaseNet / Alg
 							task = None if not tasks else tasks[i]
 							if task:
@@ -2121,16 +2163,15 @@ def evalResults(qmsmodule, qmeasures, appsmodule, algorithms, datas, seed, exect
 								)
 							try:
 								# Whether the input path is a network or a clustering
-								ifpath = net if eq in QMSINTRIN else gfpath
+								ifpath = net if intrin else gfpath
 								ifupath = ifpath
 								if ppnets:
-									if eq in QMSINTRIN:
+									if intrin:
 										raise ValueError('Per-pair evaluations on the clusterings are available only for the extrinsic measures, net: {}, qm: {}'
 											.format(net, qm))
 									ifpath = ppcl
 									ifupath = ppucl
 									assert len(cfnames) == 1, 'A single target clustering is required for the per-pair evaluation with the previous one'
-								runs = QMSRUNS.get(qm[0], 1)  # The number of quality measure runs (subsequent evaluations)
 								for inpcls, ulev, inp0 in ((cfnames, False, ifpath), (None if uclfname is None else [uclfname], True, ifupath)):
 									if not inpcls:
 										continue
@@ -2367,7 +2408,8 @@ def benchmark(*args):
 		evalResults(qmsmodule=benchevals, qmeasures=opts.qmeasures, appsmodule=benchapps
 			, algorithms=opts.algorithms, datas=opts.datas, seed=seed, exectime=exectime
 			, timeout=opts.timeout, evaltimeout=opts.evaltimeout
-			, update=opts.qupdate, revalue=opts.qrevalue)
+			, update=opts.qupdate, revalue=opts.qrevalue, compression=opts.qcompress
+			, chunks=opts.qchunks)
 			# , netnames=netnames
 
 	if opts.qaggopts is not None:
@@ -2521,6 +2563,11 @@ if __name__ == '__main__':
 			' aggregate the resulting raw quality measures'
 			' from scratch instead of retaining the existent values (for the same seed) and adding only the non-existent.',
 			'NOTE: actual (makes sense) only when --quality-noupdate is NOT applied.',
+			'  --quality-compress=<filter>  - compression filter of the created quality evaluation datasets:'
+			' gzip (default, readable by any HDF5 tool), lzf (h5py only), blosc (Blosc LZ4, requires hdf5plugin'
+			' also for reading) or none.',
+			'  --quality-chunks=<ins>,<shf>,<lev>,<run>  - chunk shape of the created quality evaluation datasets'
+			' (network instances, shuffles, levels, runs), clipped to the dataset shape. Default: automatic.',
 			'  --seedfile, -d=<seed_file>  - seed file to be used/created for the synthetic networks generation,'
 			' stochastic algorithms and quality measures execution, contains uint64_t value. Default: {seedfile}.',
 			'NOTE:',
@@ -18,7 +18,8 @@ import tarfile
 import re
 
 from multiprocessing import RLock, Value
-from math import sqrt, copysign
+from math import sqrt, fsum
+from operator import methodcaller
 from calendar import timegm  # time.struct_time -> float (seconds since the epoch)
 
 _PREFINTERNDIR = '-'  # Internal directory prefix
@@ -32,6 +33,12 @@ SEPLRD = '@'  # Links reduction value separator, must be a char
 SEPSHF = '%'  # Network shuffles separator, must be a char; ~
 SEPPATHID = '#'  # Network path id separator (to distinguish files with the same name from different dirs in the results), must be a char
 SEPSUBTASK = '>'  # Sub-task separator ('>' or '/' looks intuitive)
+# Semantic name in the canonical form: <basename>[=<apars>][^<insid>][%<shfid>][#<pathid>],
+# where the basename does not contain separators (except the first symbol);
+# the remaining names are parsed by the generic separators lookup
+_RESEMNAME = re.compile(r'(.[^{pars}{sep}]*)({pars}[^{sep}]*)?({inst}\d+)?({shf}\d+)?({pid}\d+)?\Z'.format(
+	pars=re.escape(SEPPARS), inst=re.escape(SEPINST), shf=re.escape(SEPSHF), pid=re.escape(SEPPATHID)
+	, sep=''.join(re.escape(c) for c in (SEPINST, SEPSHF, SEPPATHID))))
 UTILDIR = 'utils/'  # Utilities directory with external applications for quality evaluation and other things
 ALGSDIR = 'algorithms/'  # Default directory of the benchmarking algorithms
 TIMESTAMP_START = time.gmtime()  # struct_time
@@ -95,9 +102,15 @@ try:
 	# External package: pip install future
 	from future.utils import viewitems, viewkeys, viewvalues  #pylint: disable=W0611
 except ImportError:
-	viewitems = lambda dct: viewMethod(dct, 'items')()  #pylint: disable=W0611
-	viewkeys = lambda dct: viewMethod(dct, 'keys')()  #pylint: disable=W0611
-	viewvalues = lambda dct: viewMethod(dct, 'values')()  #pylint: disable=W0611
+	if hasattr(dict, 'viewitems'):  # Python2
+		viewitems = lambda dct: viewMethod(dct, 'items')()  #pylint: disable=W0611
+		viewkeys = lambda dct: viewMethod(dct, 'keys')()  #pylint: disable=W0611
+		viewvalues = lambda dct: viewMethod(dct, 'values')()  #pylint: disable=W0611
+	else:
+		# Note: the dict methods are views in Python3, so they are called directly without the lookup
+		viewitems = methodcaller('items')  #pylint: disable=W0611
+		viewkeys = methodcaller('keys')  #pylint: disable=W0611
+		viewvalues = methodcaller('values')  #pylint: disable=W0611
 
 
 try:
@@ -312,8 +325,12 @@ def delPathSuffix(path, nameonly=False):
 	else:
 		pdir = None
 		pname = path
+	# Parse the canonical name by a single regex match
+	mname = _RESEMNAME.match(pname)
+	if mname:
+		pname = mname.group(1)
 	# Find position of the separator symbol, considering that it can't be begin of the name
-	if len(pname) >= 2:
+	elif len(pname) >= 2:
 		# Note: +1 compensates start from the symbol at index 1. Also a separator can't be the first symbol
 		poses = [pname[1:].rfind(c) + 1 for c in (SEPINST, SEPSHF, SEPPATHID)]  # , SEPLRD;  Note: reverse direction to skip possible separator symbols in the name itself
 		poses.append(pname[1:].find(SEPPARS) + 1)  # Note: there can be a few parameters, position of the first one is required
@@ -390,6 +407,10 @@ def parseName(path, nameonly=False):
 	True
 	>>> parseName('2K5.dhrh^1') == SemName("2K5.dhrh", '', '^1', '', '')
 	True
+	>>> parseName('1K10#1^1') == SemName('1K10', '', '^1', '', '#1')
+	True
+	>>> parseName('1K10=a^b^1') == SemName('1K10', '=a^b', '^1', '', '')
+	True
 	"""
 	path = path.rstrip('/')  # Allow dir name processing (at least for the path id extraction)
 	# Separate path into base dir and name
@@ -398,6 +419,12 @@ def parseName(path, nameonly=False):
 	else:
 		pdir = None
 		pname = path
+	# Parse the canonical name by a single regex match
+	mname = _RESEMNAME.match(pname)
+	if mname:
+		basename, apars, insid, shfid, pathid = mname.group(1, 2, 3, 4, 5)
+		return SemName(basename if not pdir else '/'.join((pdir, basename))
+			, apars or '', insid or '', shfid or '', pathid or '')
 	basename = pname
 	# lnkrd = ''
 	insid = ''
@@ -446,7 +473,22 @@ def parseName(path, nameonly=False):
 
 
 class ItemsStatistic(object):
-	"""Accumulates statistics over the added items of real values or their accumulated statistics"""
+	"""Accumulates statistics over the added items of real values or their accumulated statistics
+
+	>>> st = ItemsStatistic('st', 2, 2)
+	>>> st.add(2); st.add(None); st.add(4); st.add(6); st.fix()
+	>>> st.sum, st.count, st.invals, st.min, st.max, st.avg, st.sd
+	(12, 3, 1, 2, 6, 4.0, 2.0)
+	>>> sa = ItemsStatistic('sa', 2, 2)
+	>>> sa.add(4); sa.add(8)
+	>>> sb = ItemsStatistic('sb', 2, 2)
+	>>> sb.addstat(st); sb.addstat(sa); sb.fix()
+	>>> sa.fixed, sb.sum, sb.count, sb.invals, sb.min, sb.max, sb.avg, round(sb.sd ** 2, 9)
+	(False, 24, 5, 1, 2, 8, 4.8, 5.2)
+	"""
+	__slots__ = ('name', 'sum', 'min', 'max', 'count', 'invals', 'invstats', 'fixed', 'avg', 'sd'
+		, 'statCount', 'statDelta', 'statSD', '_vals', '_sqdev')
+
 	def __init__(self, name, min0=1, max0=-1):
 		"""Constructor
 
@@ -455,7 +497,6 @@ class ItemsStatistic(object):
 		max0  - initial maximal value
 
 		sum  - sum of all values
-		sum2  - sum of squares of values
 		min  - min value
 		max  - max value
 		count  - number of valid values
@@ -470,10 +511,17 @@ class ItemsStatistic(object):
 		statCount  - total number of items in the aggregated stat items
 		statDelta  - max stat delta (max - min)
 		statSD  - average weighted (by the number of items) weighted stat SD
+
+		_vals  - valid values accumulated till the finalization, released on fix()
+			Note: the summary is evaluated by the builtin (C-implemented) reductions in fix()
+			instead of updating the running counters on each added value
+		_sqdev  - sum of the squared deviations from the mean of the merged statistics
+			(and of all values after the finalization)
+
+		Note: sum, min, max and count accumulate the merged statistics till the finalization
 		"""
 		self.name = name
 		self.sum = 0
-		self.sum2 = 0
 		self.min = min0
 		self.max = max0
 		self.count = 0
@@ -488,46 +536,84 @@ class ItemsStatistic(object):
 		self.statDelta = None
 		self.statSD = None
 
+		self._vals = []
+		self._sqdev = 0
+
+
+	@staticmethod
+	def _merge(stat, vstat):
+		"""Merge the statistics summaries
+
+		stat  - base statistics summary: (count, sum, min, max, sqdev)
+		vstat  - statistics summary to be merged: (count, sum, min, max, sqdev)
+
+		return  - merged statistics summary: (count, sum, min, max, sqdev)
+		"""
+		count, ssum, smin, smax, sqdev = stat
+		vcount, vsum, vmin, vmax, vsqdev = vstat
+		if not vcount:
+			return stat
+		sqdev += vsqdev
+		if count:
+			# Note: pairwise combination of the deviations, which is exact unlike the merge of the sums of squares
+			delta = vsum / float(vcount) - ssum / float(count)
+			sqdev += delta * delta * count * vcount / float(count + vcount)
+		return count + vcount, ssum + vsum, min(smin, vmin), max(smax, vmax), sqdev
+
+
+	def _summary(self):
+		"""Statistics summary of the merged statistics and accumulated values without the finalization
+
+		return  - statistics summary: (count, sum, min, max, sqdev)
+		"""
+		stat = (self.count, self.sum, self.min, self.max, self._sqdev)
+		vals = self._vals
+		if not vals:
+			return stat
+		vsum = sum(vals)
+		avg = vsum / float(len(vals))
+		# Note: two-pass deviation, which is numerically stable unlike the difference of
+		# the sum of squares and the squared sum
+		return self._merge(stat, (len(vals), vsum, min(vals), max(vals), fsum((v - avg) * (v - avg) for v in vals)))
+
 
 	def add(self, val):
 		"""Add real value to the accumulating statistics"""
 		assert not self.fixed, 'Only non-fixed items can be modified'
 		if val is not None:
-			self.sum += val
-			self.sum2 += copysign(val*val, val)  # Note: copysign() also implicitly validates that val is a number
-			if val < self.min:
-				self.min = val
-			if val > self.max:
-				self.max = val
-			self.count += 1
+			self._vals.append(val)
 		else:
 			self.invals += 1
 
 
 	def addstat(self, val):
-		"""Add accumulated statistics to the accumulating statistics"""
+		"""Add accumulated statistics to the accumulating statistics
+
+		val  - accumulated statistics to be added, retained unchanged (not finalized)
+		"""
 		assert not self.fixed, 'Only non-fixed items can be modified'
 		if val is not None:
-			self.sum += val.sum
-			self.sum2 += self.sum2
-			if val.min < self.min:
-				self.min = val.min
-			if val.max > self.max:
-				self.max = val.max
-			self.count += val.count
 			self.invals += val.invals
-
+			vstat = val._summary()
+			count, _vsum, vmin, vmax, sqdev = vstat
+			if not count:
+				return
+			self.count, self.sum, self.min, self.max, self._sqdev = self._merge(
+				(self.count, self.sum, self.min, self.max, self._sqdev), vstat)
+
+			vdelta = vmax - vmin
+			vsd = sqrt(sqdev / (count - 1)) if count >= 2 else None
 			if self.statCount:
-				if self.statDelta < val.max - val.min:
-					self.statDelta = val.max - val.min
-				if val.sd is not None:
+				if self.statDelta < vdelta:
+					self.statDelta = vdelta
+				if vsd is not None:
 					if self.statSD is None:
 						self.statSD = 0
-					self.statSD = (self.statSD * self.statCount + val.sd * val.count) / (self.statCount + val.count)
+					self.statSD = (self.statSD * self.statCount + vsd * count) / (self.statCount + count)
 			else:
-				self.statDelta = val.max - val.min
-				self.statSD = val.sd
-			self.statCount += val.count
+				self.statDelta = vdelta
+				self.statSD = vsd
+			self.statCount += count
 		else:
 			self.invstats += 1
 
@@ -545,14 +631,17 @@ class ItemsStatistic(object):
 
 	def fix(self):
 		"""Fix (finalize) statistics accumulation and produce the summary of the results"""
-		assert self.count >= 0, 'Count must be non-negative'
 		self.fixed = True
-		self.avg = self.sum
-		if self.count:
-			self.avg /= float(self.count)
-			if self.count >= 2:
-				count = float(self.count)
-				self.sd = sqrt(abs(self.sum2 * count - self.sum * self.sum)) / (count - 1)  # Note: corrected deviation for samples is employed
+		# Note: the initial bounds are retained if they are not exceeded
+		self.count, self.sum, self.min, self.max, self._sqdev = self._summary()
+		self._vals = []  # Release the accumulated values
+		if not self.count:
+			self.avg = self.sum
+			return
+		self.avg = self.sum / float(self.count)
+		if self.count >= 2:
+			# Corrected deviation for samples
+			self.sd = sqrt(self._sqdev / (self.count - 1))
 
 
 def envVarDefined(value, name=None, evar=None):
@@ -13,6 +13,10 @@ import os
 import sys
 # import numpy as np
 import h5py
+try:
+	import hdf5plugin  #pylint: disable=W0611;  # Registers the Blosc/LZ4 HDF5 filters to read such datasets
+except ImportError:
+	pass  # Optional, required only for the Blosc-compressed datasets
 
 try:
 	from future.utils import viewvalues, viewitems  #, viewkeys, viewvalues  # External package: pip install future
@@ -141,7 +145,7 @@ def hdf5ToCsv(args):
 			with open(inpfile, 'rb') as fstore:
 				ublock = fstore.read(ublocksize).decode().rstrip('\0')
 		except OSError:
-			print('WARNING, can not open the file {}.'.format(inpfile, file=sys.stderr))
+			print('WARNING, can not open the file {}.'.format(inpfile), file=sys.stderr)
 		with h5py.File(inpfile, mode='r', driver='core', libver='latest') as fstore:
 			inpname, inpext = os.path.splitext(inpfile)
 			# Prevent overwriting of the input files
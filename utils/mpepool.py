@@ -65,6 +65,7 @@ import itertools  # chain
 from multiprocessing import cpu_count, Lock  #, Queue  #, active_children, Value, Process
 from collections import deque
 from math import sqrt
+from operator import methodcaller
 
 # Consider time interface compatibility with Python before v3.3
 if not hasattr(time, 'perf_counter'):
@@ -92,9 +93,14 @@ except ImportError:
 			ometh = getattr(obj, method)
 		return ometh
 
-	viewitems = lambda dct: viewMethod(dct, 'items')()
-	#viewkeys = lambda dct: viewMethod(dct, 'keys')()
-	viewvalues = lambda dct: viewMethod(dct, 'values')()
+	if hasattr(dict, 'viewitems'):  # Python2
+		viewitems = lambda dct: viewMethod(dct, 'items')()
+		#viewkeys = lambda dct: viewMethod(dct, 'keys')()
+		viewvalues = lambda dct: viewMethod(dct, 'values')()
+	else:
+		# Note: the dict methods are views in Python3, so they are called directly without the lookup
+		viewitems = methodcaller('items')
+		viewvalues = methodcaller('values')
 
 	# Replace range() implementation for Python2
 	try:
@@ -753,7 +759,7 @@ class Task(object):
 				self.numterm += 1
 		except KeyError as err:
 			print('ERROR in "{}" succeed: {}, the finishing "{}" should be among the active subtasks: {}. {}'
-				.format(self.name, succeed, subtask, err, traceback.format_exc(5), file=sys.stderr))
+				.format(self.name, succeed, subtask, err, traceback.format_exc(5)), file=sys.stderr)
 		finally:
 			self._lock.release()
 		# Consider onfinish callback
@@ -1725,7 +1731,7 @@ class ExecPool(object):
 				# Note: it just interrupts job start, but does not cause termination
 				# of the whole (already terminated) execution pool
 				print("WARNING, The execution pool{} is terminated and can't response the UI command: {}"
-					.format('' if not self.name else ' ' + self.name, self._uicmd.id.name, file=sys.stderr))
+					.format('' if not self.name else ' ' + self.name, self._uicmd.id.name), file=sys.stderr)
 				return
 			smr = None
 			try:
@@ -2300,6 +2306,9 @@ class ExecPool(object):
 					raise EnvironmentError((errno.EINTR,  # errno.ERESTART
 						'Jobs can not be started because the execution pool has been terminated'))
 				# bufsize=-1 - use system default IO buffer size
+				# Note: preexec_fn and user/group switching are not used to retain the vfork() fast path
+				# of the child process creation (CPython 3.10+ on Linux) without copying the page tables
+				# of the pool process; posix_spawn() is not applicable since the job has its own cwd
 				job.proc = subprocess.Popen(job.args, bufsize=-1, cwd=job.workdir, stdout=job._stdout, stderr=job._stderr)
 				# Update job logging descriptors in case of PIPEs to the actual system objects
 				if job._stdout is subprocess.PIPE: